@@ -1,16 +1,20 @@
 # src/config.py
-import copy
+from typing import Any, Mapping, NamedTuple
+import numpy as np
 from src.units import ureg
 
+_KG_PER_KWH = ureg("kg/kWh")
+_KWH_PER_KG = ureg("kWh/kg")
+
 # ----------------------------------------------------------------------
 # EMISSION FACTORS
 # ----------------------------------------------------------------------
 EMISSION_FACTORS = {
     "INCINERATION": {
         # Emission factors given per kWh.
-        "carbon_content_fossil": 0.097 * ureg("kg/kWh"),      # kg CO₂/kWh (fossil-derived)
-        "carbon_content_biogenic": 0.054 * ureg("kg/kWh"),      # kg CO₂/kWh (biogenic-derived)
-        "energy_content": 5.3 * ureg("kWh/kg"),                # Bujak, J. (2010)
+        "carbon_content_fossil": 0.097 * _KG_PER_KWH,      # kg CO₂/kWh (fossil-derived)
+        "carbon_content_biogenic": 0.054 * _KG_PER_KWH,      # kg CO₂/kWh (biogenic-derived)
+        "energy_content": 5.3 * _KWH_PER_KG,                # Bujak, J. (2010)
         "nitrogen_frac_organic": 9.1e-6,     # Unitless (kg NH₃ per kg waste)
         "sulfur_frac_organic": 0.0002,       # Unitless
         "so2_conversion": 0.85,              # Dimensionless
@@ -82,6 +86,65 @@ EMISSION_FACTORS = {
     },
 }
 
+# ----------------------------------------------------------------------
+# FROZEN EMISSION FACTOR RECORDS
+# ----------------------------------------------------------------------
+# Processes convert their factor dictionaries into these records once, at construction,
+# so the emission calculations read plain floats through attribute access. Quantities are
+# converted to the units in UNITS before their magnitudes are taken.
+
+def _freeze_factors(record_type, factors: Mapping[str, Any]):
+    values = {}
+    for name, value in factors.items():
+        if name not in record_type._fields:
+            continue
+        if name in record_type.UNITS and hasattr(value, "to"):
+            value = value.to(record_type.UNITS[name])
+        values[name] = float(getattr(value, "magnitude", value))
+    return record_type(**values)
+
+
+class IncinerationFactors(NamedTuple):
+    """The EMISSION_FACTORS["INCINERATION"] entries read by IncinerationProcess, as floats."""
+    carbon_content_fossil: float
+    carbon_content_biogenic: float
+    energy_content: float
+    so2_conversion: float
+    pm10_per_organic: float
+    pm25_per_organic: float
+    nox_per_waste: float
+    hg_volatilization: float
+    pb_volatilization: float
+    combustion_efficiency: float = 1.0
+
+    UNITS = {
+        "carbon_content_fossil": "kg/kWh",
+        "carbon_content_biogenic": "kg/kWh",
+        "energy_content": "kWh/kg",
+    }
+
+    @classmethod
+    def from_mapping(cls, factors: Mapping[str, Any]) -> "IncinerationFactors":
+        return _freeze_factors(cls, factors)
+
+
+class PyrolysisFactors(NamedTuple):
+    """The EMISSION_FACTORS["PYROLYSIS"] entries read by PyrolysisProcess, as floats."""
+    co2_fossil_per_organic: float
+    ch4_fossil_per_organic: float
+    nmvoc_per_organic: float
+    pahs_per_organic: float
+    dioxin_per_chlorinated: float
+    hg_per_mercury: float
+    pb_per_heavy_metal: float
+
+    UNITS = {}
+
+    @classmethod
+    def from_mapping(cls, factors: Mapping[str, Any]) -> "PyrolysisFactors":
+        return _freeze_factors(cls, factors)
+
+
 # ----------------------------------------------------------------------
 # DEFAULT WASTE COMPOSITION
 # ----------------------------------------------------------------------
@@ -117,6 +180,65 @@ DEFAULT_COMPOSITION = {
     },
 }
 
+# Fixed column order used when compositions are packed into arrays
+# (one column per leaf fraction of DEFAULT_COMPOSITION).
+COMPONENT_INDEX = (
+    "non_hazardous",
+    "body_fluids",
+    "lab_cultures",
+    "needles_sharps_plastic",
+    "needles_sharps_metal",
+    "pharmaceuticals",
+    "pharmaceuticals_halogenated",
+    "lab_reagents",
+    "lab_cultures_disinfectants",
+    "cytotoxic_organic",
+    "cytotoxic_halogenated",
+    "mercury_waste",
+    "other_heavy_metals",
+    "radioactive_metals",
+    "radioactive_organic",
+)
+
+# DEFAULT_COMPOSITION laid out along COMPONENT_INDEX (read-only).
+DEFAULT_COMPOSITION_VEC = np.array(
+    [next(group[name] for group in DEFAULT_COMPOSITION.values() if name in group)
+     for name in COMPONENT_INDEX],
+    dtype=np.float64,
+)
+DEFAULT_COMPOSITION_VEC.setflags(write=False)
+
+# Items that make up the organic fraction of a waste stream, of which the plastic share
+# is treated as fossil-derived, and the halogenated items that make up the chlorinated fraction.
+ORGANIC_ITEMS = (
+    "non_hazardous",
+    "body_fluids",
+    "lab_cultures",
+    "pharmaceuticals",
+    "cytotoxic_organic",
+    "radioactive_organic",
+    "needles_sharps_plastic",
+)
+FOSSIL_ORGANIC_ITEM = "needles_sharps_plastic"
+CHLORINATED_ITEMS = ("pharmaceuticals_halogenated", "cytotoxic_halogenated")
+
+# Column positions in composition vectors/matrices laid out along COMPONENT_INDEX.
+COMPONENT_COLUMNS = {name: i for i, name in enumerate(COMPONENT_INDEX)}
+FOSSIL_ORGANIC_COL = COMPONENT_COLUMNS[FOSSIL_ORGANIC_ITEM]
+MERCURY_COL = COMPONENT_COLUMNS["mercury_waste"]
+LEAD_COL = COMPONENT_COLUMNS["other_heavy_metals"]
+
+def _column_weights(items):
+    # 0/1 weight vector over COMPONENT_INDEX (read-only), so a fraction sum over a
+    # composition matrix is a single matrix-vector product.
+    weights = np.zeros(len(COMPONENT_INDEX))
+    weights[[COMPONENT_COLUMNS[item] for item in items]] = 1.0
+    weights.setflags(write=False)
+    return weights
+
+ORGANIC_WEIGHTS = _column_weights(ORGANIC_ITEMS)
+CHLORINATED_WEIGHTS = _column_weights(CHLORINATED_ITEMS)
+
 # ----------------------------------------------------------------------
 # HOSPITAL-SPECIFIC INDIRECT FACTORS
 # ----------------------------------------------------------------------
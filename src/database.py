@@ -1,9 +1,17 @@
 # HospitalWasteManagement/src/database.py
 
+import hashlib
 import logging
+import pickle
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import brightway2 as bw
+from bw2data.backends.peewee import sqlite3_lci_db
+
+# Where build_flow_index keeps its pickled flow indexes between runs.
+FLOW_INDEX_CACHE_DIR = Path.home() / ".cache" / "hwm"
+# Bump whenever the layout of the pickled flow index changes, so older caches are never loaded.
+FLOW_INDEX_FORMAT = 2
 
 def setup_project(project_name: str) -> bw.Database:
     if project_name not in bw.projects:
@@ -14,20 +22,61 @@ def setup_project(project_name: str) -> bw.Database:
     logging.info("Biosphere3 setup complete.")
     return bw.Database("biosphere3")
 
-def build_flow_index(bio_db: bw.Database) -> Dict[str, Any]:
-    index = {}
-    for flow in bio_db:
-        index[flow["code"]] = flow
+def _flow_index_cache_path(bio_db: bw.Database, cache_dir: Path) -> Path:
+    # The cache is invalidated whenever the index format, project, flow count or modification
+    # stamp changes.
+    metadata = bw.databases[bio_db.name]
+    signature = repr((FLOW_INDEX_FORMAT, bw.projects.current, bio_db.name, len(bio_db),
+                      metadata.get("modified"), metadata.get("processed")))
+    digest = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"flow_index_{digest}.pkl"
+
+def build_flow_index(bio_db: bw.Database,
+                     cache_dir: Optional[Path] = FLOW_INDEX_CACHE_DIR) -> Dict[str, tuple]:
+    """
+    Maps the code of every flow in the biosphere database to its (database, code) key.
+
+    Iterating biosphere3 is slow, so the index is pickled to cache_dir and reloaded on later
+    runs as long as the database is unchanged. Pass cache_dir=None to always rebuild it.
+
+    Args:
+        bio_db (bw.Database): The biosphere database, as returned by setup_project.
+        cache_dir (Optional[Path]): Directory for the cached index, or None to disable caching.
+
+    Returns:
+        Dict[str, tuple]: The flow index.
+    """
+    cache_path = _flow_index_cache_path(bio_db, cache_dir) if cache_dir is not None else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            with cache_path.open("rb") as fh:
+                return pickle.load(fh)
+        except Exception as e:  # Any unreadable or stale cache is simply rebuilt.
+            logging.warning(f"Ignoring unreadable flow index cache '{cache_path}': {e}")
+
+    index = {flow["code"]: flow.key for flow in bio_db}
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("wb") as fh:
+                pickle.dump(index, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logging.warning(f"Could not write flow index cache '{cache_path}': {e}")
     return index
 
-def get_flow_by_uuid(flow_index: Dict[str, Any], uuid: str) -> Any:
-    if uuid in flow_index:
-        return flow_index[uuid]
-    else:
+def get_flow_by_uuid(flow_index: Dict[str, tuple], uuid: str) -> tuple:
+    flow = flow_index.get(uuid)
+    if flow is None:
         logging.error(f"Flow with UUID {uuid} not found.")
         raise KeyError(f"Flow with UUID {uuid} missing.")
+    return flow
 
-def retrieve_flows(flow_index: Dict[str, Any]) -> Dict[str, Any]:
+def retrieve_flows(flow_index: Dict[str, tuple]) -> Dict[str, Optional[tuple]]:
+    """
+    Resolves the biosphere flows used by the emission models to their (database, code) keys,
+    ready to be used as exchange inputs. Flows missing from the index map to None.
+    """
     flow_uuids = {
         "co2_fossil": "aa7cac3a-3625-41d4-bc54-33e2cf11ec46",
         "co2_biogenic": "d6235194-e4e6-4548-bfa3-ac095131aef4",
@@ -46,13 +95,11 @@ def retrieve_flows(flow_index: Dict[str, Any]) -> Dict[str, Any]:
         "chlorine_air": "247ac273-60fa-4e21-9408-793f75fa1d37",
         "land_occupation": "1eaa9ea4-40b8-414a-b198-5626400372e1",
     }
-    flows = {}
-    for key, uuid in flow_uuids.items():
-        try:
-            flows[key] = get_flow_by_uuid(flow_index, uuid)
-        except KeyError:
-            flows[key] = None
-    return flows
+    flow_keys = {key: flow_index.get(uuid) for key, uuid in flow_uuids.items()}
+    for key, flow_key in flow_keys.items():
+        if flow_key is None:
+            logging.error(f"Flow with UUID {flow_uuids[key]} not found.")
+    return flow_keys
 
 def create_or_reset_db(db_name: str) -> bw.Database:
     if db_name in bw.databases:
@@ -95,20 +142,35 @@ def add_production_exchange(act: Any, amount: float = 1.0):
         input=act.key
     ).save()
 
-def add_biosphere_exchanges(act: Any, emissions: Dict[str, Any], flows: Dict[str, Any]):
+def add_biosphere_exchanges(act: Any, emissions: Dict[str, Any], flows: Dict[str, Optional[tuple]]):
+    """
+    Adds a biosphere exchange to the activity for every non-negligible emission.
+
+    Args:
+        act (Any): The activity to add the exchanges to.
+        emissions (Dict[str, Any]): Emission amounts as Pint quantities, keyed by flow name.
+        flows (Dict[str, Optional[tuple]]): Flow keys keyed by flow name, as returned by retrieve_flows.
+    """
+    # Resolve flows and drop negligible amounts before touching the database.
+    exchanges = []
     for flow_name, amount in emissions.items():
-        flow_obj = flows.get(flow_name)
-        if flow_obj is None:
+        flow_key = flows.get(flow_name)
+        if flow_key is None:
             logging.error(f"Missing flow for '{flow_name}'. Skipping exchange.")
             continue
-        if abs(amount.magnitude) <= 1e-15:
-            continue
-        try:
-            act.new_exchange(
-                amount=amount.magnitude,
-                type="biosphere",
-                unit=str(amount.units),
-                input=flow_obj.key
-            ).save()
-        except Exception as e:
-            logging.error(f"Failed to add exchange for '{act['name']}' with flow '{flow_name}': {e}")
+        magnitude = amount.magnitude
+        if abs(magnitude) > 1e-15:
+            exchanges.append((flow_name, flow_key, magnitude, str(amount.units)))
+
+    # Save all exchanges in one SQLite transaction instead of committing each one.
+    with sqlite3_lci_db.atomic():
+        for flow_name, flow_key, magnitude, unit in exchanges:
+            try:
+                act.new_exchange(
+                    amount=magnitude,
+                    type="biosphere",
+                    unit=unit,
+                    input=flow_key
+                ).save()
+            except Exception as e:
+                logging.error(f"Failed to add exchange for '{act['name']}' with flow '{flow_name}': {e}")
@@ -10,7 +10,7 @@ from src.units import ureg
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 from src import config
-from src.waste_stream import WasteStream
+from src.waste_stream import WasteStream, stack_waste_streams
 from src.processes.incineration import IncinerationProcess
 from src.processes.landfill import LandfillProcess
 from src.processes.pyrolysis import PyrolysisProcess
@@ -124,15 +124,24 @@ def main():
     for scenario_name, scen in scenarios.items():
         logging.info(f"Running scenario: {scenario_name} - {scen['description']}")
         results[scenario_name] = {}
-        for hospital in hospitals:
+        
+        # Create and segregate a waste stream for every hospital, then evaluate the processes
+        # that support batch calculations once for all hospitals.
+        adjusted_wastes = [
+            WasteStream(mass=hospital["waste"] * ureg("kg")).adjust_for_segregation(scen["segregation_efficiency"])
+            for hospital in hospitals
+        ]
+        masses, comp_matrix = stack_waste_streams(adjusted_wastes)
+        batch_emissions = {
+            process_key: process_obj.calculate_direct_emissions_batch(masses, comp_matrix, scenario=scen)
+            for process_key, process_obj in processes.items()
+            if hasattr(process_obj, "calculate_direct_emissions_batch")
+        }
+        
+        for row, (hospital, adjusted_waste) in enumerate(zip(hospitals, adjusted_wastes)):
             hosp_name = hospital["name"]
             results[scenario_name][hosp_name] = {}
             
-            # Create a waste stream object for the hospital.
-            waste_mass = hospital["waste"] * ureg("kg")
-            waste_stream = WasteStream(mass=waste_mass)
-            adjusted_waste = waste_stream.adjust_for_segregation(scen["segregation_efficiency"])
-            
             # Set up the indirect emissions calculator if hospital-specific factors exist.
             indirect_factors = config.HOSPITAL_INDIRECT_FACTORS.get(hosp_name, {})
             indirect_calc = IndirectEmissionsCalculator(indirect_factors) if indirect_factors else None
@@ -145,7 +154,10 @@ def main():
                 add_production_exchange(activity)
                 
                 # Calculate direct emissions using the process model.
-                direct_emissions = process_obj.calculate_direct_emissions(adjusted_waste, scenario=scen)
+                if process_key in batch_emissions:
+                    direct_emissions = {key: values[row] for key, values in batch_emissions[process_key].items()}
+                else:
+                    direct_emissions = process_obj.calculate_direct_emissions(adjusted_waste, scenario=scen)
                 
                 # Add indirect emissions if applicable.
                 if indirect_calc:
@@ -0,0 +1,52 @@
+# HospitalWasteManagement/src/processes/_kernels.py
+"""
+Array kernels behind the batch emission calculations.
+
+Each kernel writes one row of `out` per pollutant (in the order of the matching *_OUTPUTS
+tuple) and one column per waste stream. When Numba is installed the kernels are compiled
+with @njit(parallel=True, fastmath=True), which fuses the array expressions into a single
+parallel loop over the streams; without Numba they run unchanged as NumPy code.
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is optional.
+    njit = None
+
+
+def _jit(func):
+    if njit is None:
+        return func
+    return njit(parallel=True, fastmath=True, cache=True)(func)
+
+
+INCINERATION_OUTPUTS = ("co2_fossil", "co2_biogenic", "so2", "nox", "pm10", "pm25", "hg", "pb")
+
+@_jit
+def incineration_kernel(mass, total_org, fossil_org, hg_frac, pb_frac,
+                        f_cf, f_cb, f_ec, f_so2, f_nox, f_pm10, f_pm25,
+                        f_hg, f_pb, out):
+    energy = mass * f_ec
+    organic_mass = mass * total_org
+    out[0] = fossil_org * energy * (f_cf * (44 / 12))
+    out[1] = (total_org - fossil_org) * energy * (f_cb * (44 / 12))
+    out[2] = organic_mass * (f_so2 * (64 / 32))
+    out[3] = mass * f_nox
+    out[4] = organic_mass * f_pm10
+    out[5] = organic_mass * f_pm25
+    out[6] = mass * hg_frac * f_hg
+    out[7] = mass * pb_frac * f_pb
+
+
+PYROLYSIS_OUTPUTS = ("co2_fossil", "ch4_fossil", "nmvoc", "pahs", "dioxin", "hg", "pb")
+
+@_jit
+def pyrolysis_kernel(mass, total_org, total_chlor, hg_frac, pb_frac,
+                     f_co2, f_ch4, f_nmvoc, f_pahs, f_dioxin, f_hg, f_pb, out):
+    organic_mass = mass * total_org
+    out[0] = organic_mass * f_co2
+    out[1] = organic_mass * f_ch4
+    out[2] = organic_mass * f_nmvoc
+    out[3] = organic_mass * f_pahs
+    out[4] = mass * total_chlor * f_dioxin
+    out[5] = mass * hg_frac * f_hg
+    out[6] = mass * pb_frac * f_pb
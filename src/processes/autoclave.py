@@ -1,6 +1,5 @@
 # HospitalWasteManagement/src/processes/autoclave.py
 
-import pint
 from src.processes.base import TreatmentProcess
 from src.units import ureg
 import logging
@@ -46,9 +45,9 @@ class AutoclaveProcess(TreatmentProcess):
         # - From general waste: non_hazardous
         # - From infectious waste: body_fluids and lab_cultures
         total_organic = (
-            waste.composition.get("general_waste", {}).get("non_hazardous", 0) +
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0)
+            waste.composition.get("non_hazardous", 0) +
+            waste.composition.get("body_fluids", 0) +
+            waste.composition.get("lab_cultures", 0)
         )
 
         # Calculate the temperature difference factor for NMVOC emissions.
@@ -68,7 +67,7 @@ class AutoclaveProcess(TreatmentProcess):
             "pm10": mass * total_organic * f["pm10_per_organic"] * ureg("kg"),
             "pm25": mass * total_organic * f["pm25_per_organic"] * ureg("kg"),
             "co2_fossil": energy_co2 * ureg("kg"),
-            "hg": mass * waste.composition.get("heavy_metals_waste", {}).get("mercury_waste", 0) * f["hg_leach_factor"] * ureg("kg"),
+            "hg": mass * waste.composition.get("mercury_waste", 0) * f["hg_leach_factor"] * ureg("kg"),
         }
         logging.debug(f"{self.name} - Calculated emissions: {emissions}")
         return emissions
@@ -2,7 +2,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 import pint
-from src.units import ureg
 
 
 class TreatmentProcess(ABC):
@@ -1,7 +1,6 @@
 # HospitalWasteManagement/src/processes/chem_disinfection.py
 
 import copy
-import pint
 from src.processes.base import TreatmentProcess
 from src.units import ureg
 import logging
@@ -40,8 +39,8 @@ class ChemDisinfectionProcess(TreatmentProcess):
         # - From general waste: non_hazardous
         # - From infectious waste: body_fluids and lab_cultures
         org_sum = (
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0)
+            waste.composition.get("body_fluids", 0) +
+            waste.composition.get("lab_cultures", 0)
         )
         
         # Convert waste mass to kilograms.
@@ -1,10 +1,27 @@
 # HospitalWasteManagement/src/processes/incineration.py
-import copy
-import pint
+from functools import lru_cache
+import numpy as np
+from src import config
+from src.processes._kernels import INCINERATION_OUTPUTS, incineration_kernel
 from src.processes.base import TreatmentProcess
 from src.units import ureg
 import logging
 
+_KG = ureg("kg")
+
+
+@lru_cache(maxsize=64)
+def _adjusted_factors(f: config.IncinerationFactors, efficiency: float) -> config.IncinerationFactors:
+    """
+    Scales the PM10, PM25 and NOₓ factors by (1 - efficiency) for flue-gas cleaning.
+    Memoized, since scenario sweeps reuse a handful of efficiencies across many waste streams.
+    """
+    return f._replace(
+        pm10_per_organic=f.pm10_per_organic * (1 - efficiency),
+        pm25_per_organic=f.pm25_per_organic * (1 - efficiency),
+        nox_per_waste=f.nox_per_waste * (1 - efficiency),
+    )
+
 class IncinerationProcess(TreatmentProcess):
     """
     Implements direct emission calculations for incineration.
@@ -24,53 +41,88 @@ class IncinerationProcess(TreatmentProcess):
       If a scenario dictionary is provided and contains an "incineration_flue_gas_efficiency" key,
       the factors for PM10, PM25, and NOₓ are scaled to reflect improvements from flue-gas cleaning.
     """
+    def __init__(self, name: str, factors: dict):
+        super().__init__(name, factors)
+        self._factors_tuple = config.IncinerationFactors.from_mapping(factors)
+
     def calculate_direct_emissions(self, waste, scenario: dict = None) -> dict:
         logging.debug(f"{self.name} - Input waste composition: {waste.composition}")
-        f = copy.deepcopy(self.factors)
+        f = self._factors_tuple
         
         # Apply scenario adjustments for flue gas cleaning.
         if scenario and "incineration_flue_gas_efficiency" in scenario:
-            efficiency = scenario["incineration_flue_gas_efficiency"]
-            f["pm10_per_organic"] *= (1 - efficiency)
-            f["pm25_per_organic"] *= (1 - efficiency)
-            f["nox_per_waste"] *= (1 - efficiency)
+            f = _adjusted_factors(f, scenario["incineration_flue_gas_efficiency"])
         
-        # Calculate total organic fraction.
-        total_organic = (
-            waste.composition.get("general_waste", {}).get("non_hazardous", 0) +
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0) +
-            waste.composition.get("pharmaceutical_waste", {}).get("pharmaceuticals", 0) +
-            waste.composition.get("chemical_waste", {}).get("cytotoxic_organic", 0) +
-            waste.composition.get("radioactive_waste", {}).get("radioactive_organic", 0) +
-            waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0)
-        )
-        fossil_organic = waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0)
+        # Organic fractions, memoized on the waste stream.
+        total_organic = waste.total_organic
+        fossil_organic = waste.fossil_organic
         biogenic_organic = total_organic - fossil_organic
         
-        # Use the full Pint quantity for mass.
-        mass_q = waste.mass.to("kg")  # mass_q has units [kg]
+        # Heavy metal fractions of the flat composition.
+        comp = waste.composition
+        hg_frac = comp.get("mercury_waste", 0.0)
+        pb_frac = comp.get("other_heavy_metals", 0.0)
+        
+        # All arithmetic is done on magnitudes; units are attached once at the end.
+        mass = waste.mass.to("kg").magnitude
+        
+        # Energy in kWh: (kg) * (kWh/kg). Multiplied by the carbon contents [kg/kWh] this gives kg.
+        energy = mass * f.energy_content
+        organic_mass = mass * total_organic
         
-        # Calculate energy in kWh: (kg) * (kWh/kg) = kWh.
-        energy = mass_q * f["energy_content"]
+        # Particulates rise by twice the shortfall of combustion efficiency below 0.95.
+        pm_multiplier = 1.0 + max(0.0, 0.95 - f.combustion_efficiency) * 2.0
+        pm10 = organic_mass * f.pm10_per_organic * pm_multiplier
+        pm25 = organic_mass * f.pm25_per_organic * pm_multiplier
         
         emissions = {
-            # fossil_organic is dimensionless; energy has units [kWh],
-            # f["carbon_content_fossil"] has units [kg/kWh] so the product is in [kg].
-            "co2_fossil": fossil_organic * energy * f["carbon_content_fossil"] * (44 / 12),
-            "co2_biogenic": biogenic_organic * energy * f["carbon_content_biogenic"] * (44 / 12),
-            "so2": total_organic * mass_q.magnitude * f["so2_conversion"] * (64 / 32) * ureg("kg"),
-            "nox": mass_q.magnitude * f["nox_per_waste"] * ureg("kg"),
-            "pm10": mass_q.magnitude * total_organic * f["pm10_per_organic"] * ureg("kg"),
-            "pm25": mass_q.magnitude * total_organic * f["pm25_per_organic"] * ureg("kg"),
-            "hg": mass_q.magnitude * waste.composition.get("heavy_metals_waste", {}).get("mercury_waste", 0) * f["hg_volatilization"] * ureg("kg"),
-            "pb": mass_q.magnitude * waste.composition.get("heavy_metals_waste", {}).get("other_heavy_metals", 0) * f["pb_volatilization"] * ureg("kg"),
+            "co2_fossil": fossil_organic * energy * f.carbon_content_fossil * (44 / 12) * _KG,
+            "co2_biogenic": biogenic_organic * energy * f.carbon_content_biogenic * (44 / 12) * _KG,
+            "so2": organic_mass * f.so2_conversion * (64 / 32) * _KG,
+            "nox": mass * f.nox_per_waste * _KG,
+            "pm10": pm10 * _KG,
+            "pm25": pm25 * _KG,
+            "hg": mass * hg_frac * f.hg_volatilization * _KG,
+            "pb": mass * pb_frac * f.pb_volatilization * _KG,
         }
         
-        if f.get("combustion_efficiency", 1.0) < 0.95:
-            penalty = (0.95 - f["combustion_efficiency"]) * 2
-            emissions["pm10"] *= (1 + penalty)
-            emissions["pm25"] *= (1 + penalty)
-        
         logging.debug(f"{self.name} - Calculated emissions: {emissions}")
         return emissions
+
+    def calculate_direct_emissions_batch(self, masses: np.ndarray, comp_matrix: np.ndarray,
+                                         scenario: dict = None) -> dict:
+        """
+        Vectorized counterpart of calculate_direct_emissions for many waste streams at once.
+
+        Args:
+            masses (np.ndarray): A (N,) array of waste masses in kg.
+            comp_matrix (np.ndarray): A (N, len(config.COMPONENT_INDEX)) array of composition
+                fractions, e.g. as built by src.waste_stream.stack_waste_streams.
+            scenario (dict, optional): Scenario parameters, applied as in calculate_direct_emissions.
+
+        Returns:
+            dict: A dictionary mapping emission keys to (N,) arrays wrapped as Pint quantities in kg.
+        """
+        f = self._factors_tuple
+        if scenario and "incineration_flue_gas_efficiency" in scenario:
+            f = _adjusted_factors(f, scenario["incineration_flue_gas_efficiency"])
+
+        pm_multiplier = 1.0 + max(0.0, 0.95 - f.combustion_efficiency) * 2.0
+
+        masses = np.ascontiguousarray(masses, dtype=np.float64)
+        comp_matrix = np.asarray(comp_matrix, dtype=np.float64)
+        out = np.empty((len(INCINERATION_OUTPUTS), masses.shape[0]), dtype=np.float64)
+        incineration_kernel(
+            masses,
+            comp_matrix @ config.ORGANIC_WEIGHTS,
+            np.ascontiguousarray(comp_matrix[:, config.FOSSIL_ORGANIC_COL]),
+            np.ascontiguousarray(comp_matrix[:, config.MERCURY_COL]),
+            np.ascontiguousarray(comp_matrix[:, config.LEAD_COL]),
+            f.carbon_content_fossil, f.carbon_content_biogenic, f.energy_content,
+            f.so2_conversion, f.nox_per_waste,
+            f.pm10_per_organic * pm_multiplier, f.pm25_per_organic * pm_multiplier,
+            f.hg_volatilization, f.pb_volatilization,
+            out,
+        )
+        emissions = dict(zip(INCINERATION_OUTPUTS, out))
+        return {key: value * _KG for key, value in emissions.items()}
@@ -2,7 +2,6 @@
 
 import copy
 import math
-import pint
 from src.processes.base import TreatmentProcess
 from src.units import ureg
 import logging
@@ -41,14 +40,15 @@ class LandfillProcess(TreatmentProcess):
         
         # Retrieve the organic fractions from the waste composition:
         # Fast-degrading organics are assumed to come from infectious waste.
+        comp = waste.composition
         biodeg_frac = (
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0)
+            comp.get("body_fluids", 0) +
+            comp.get("lab_cultures", 0)
         )
         # Slow-degrading organics are assumed to come from sharps and pharmaceuticals.
         slow_frac = (
-            waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0) +
-            waste.composition.get("pharmaceutical_waste", {}).get("pharmaceuticals", 0)
+            comp.get("needles_sharps_plastic", 0) +
+            comp.get("pharmaceuticals", 0)
         )
         
         # Calculate the fraction of organics that have decayed over the time period.
@@ -69,9 +69,9 @@ class LandfillProcess(TreatmentProcess):
         emissions = {
             "ch4_biogenic": ch4_biogenic * ureg("kg"),
             "co2_biogenic": co2_biogenic * ureg("kg"),
-            # Retrieve heavy metals from 'heavy_metals_waste' instead of 'metallic_materials'
-            "hg": mass * waste.composition.get("heavy_metals_waste", {}).get("mercury_waste", 0) * f["hg_factor"] * t * ureg("kg"),
-            "pb": mass * waste.composition.get("heavy_metals_waste", {}).get("other_heavy_metals", 0) * f["pb_factor"] * t * ureg("kg"),
+            # Heavy metals are the items of the 'heavy_metals_waste' group.
+            "hg": mass * comp.get("mercury_waste", 0) * f["hg_factor"] * t * ureg("kg"),
+            "pb": mass * comp.get("other_heavy_metals", 0) * f["pb_factor"] * t * ureg("kg"),
             "nmvoc": nmvoc_emission * ureg("kg"),
             "nh3": nh3_emission * ureg("kg"),
         }
@@ -1,7 +1,6 @@
 # HospitalWasteManagement/src/processes/microwave.py
 
 import copy
-import pint
 from src.processes.base import TreatmentProcess
 from src.units import ureg
 import logging
@@ -32,19 +31,11 @@ class MicrowaveProcess(TreatmentProcess):
         # Work on a copy of the factors to avoid modifying the original.
         f = copy.deepcopy(self.factors)
         
-        # Instead of using waste.composition["organic_materials"], we sum the relevant organic fractions:
-        total_organic = (
-            waste.composition.get("general_waste", {}).get("non_hazardous", 0) +
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0) +
-            waste.composition.get("pharmaceutical_waste", {}).get("pharmaceuticals", 0) +
-            waste.composition.get("chemical_waste", {}).get("cytotoxic_organic", 0) +
-            waste.composition.get("radioactive_waste", {}).get("radioactive_organic", 0) +
-            waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0)
-        )
+        # Total organic fraction, memoized on the waste stream.
+        total_organic = waste.total_organic
         
         # Calculate the plastic fraction from sharps waste (needles_sharps_plastic).
-        plastic_component = waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0)
+        plastic_component = waste.fossil_organic
         plastic_frac = (plastic_component / total_organic) if total_organic > 0 else 0
         
         # Compute the frequency multiplier based on the difference between the base and operating frequencies.
@@ -66,7 +57,7 @@ class MicrowaveProcess(TreatmentProcess):
         # CO₂ emissions from electricity consumption.
         energy_co2 = mass * f["elec_per_waste"] * f["grid_co2_factor"]
         # Metal aerosol emissions for lead from the heavy metals fraction.
-        metal_emissions = mass * waste.composition.get("heavy_metals_waste", {}).get("other_heavy_metals", 0) * f["metal_aerosol_factor"]
+        metal_emissions = mass * waste.composition.get("other_heavy_metals", 0) * f["metal_aerosol_factor"]
         
         # Construct the emissions dictionary, attaching units via Pint.
         emissions = {
@@ -1,9 +1,14 @@
 # HospitalWasteManagement/src/processes/pyrolysis.py
+import numpy as np
+from src import config
+from src.processes._kernels import PYROLYSIS_OUTPUTS, pyrolysis_kernel
 from src.processes.base import TreatmentProcess
-import pint
 from src.units import ureg
 import logging
 
+_KG = ureg("kg")
+
+
 class PyrolysisProcess(TreatmentProcess):
     """
     Implements direct emission calculations for the pyrolysis treatment process.
@@ -23,41 +28,69 @@ class PyrolysisProcess(TreatmentProcess):
       - The method accepts an optional `scenario` dictionary. In this basic implementation, scenario
         parameters are not used to modify the factors, but the parameter is available for future extensions.
     """
+    def __init__(self, name: str, factors: dict):
+        super().__init__(name, factors)
+        self._factors_tuple = config.PyrolysisFactors.from_mapping(factors)
+
     def calculate_direct_emissions(self, waste, scenario: dict = None) -> dict:
         logging.debug(f"{self.name} - Input waste composition: {waste.composition}")
         # Use the emission factors provided for pyrolysis.
-        f = self.factors
+        f = self._factors_tuple
         
-        # Calculate total organic fraction from the provided waste composition.
-        total_organic = (
-            waste.composition.get("general_waste", {}).get("non_hazardous", 0) +
-            waste.composition.get("infectious_waste", {}).get("body_fluids", 0) +
-            waste.composition.get("infectious_waste", {}).get("lab_cultures", 0) +
-            waste.composition.get("pharmaceutical_waste", {}).get("pharmaceuticals", 0) +
-            waste.composition.get("chemical_waste", {}).get("cytotoxic_organic", 0) +
-            waste.composition.get("radioactive_waste", {}).get("radioactive_organic", 0) +
-            waste.composition.get("sharps_waste", {}).get("needles_sharps_plastic", 0)
-        )
+        # Total organic and chlorinated fractions, memoized on the waste stream.
+        total_organic = waste.total_organic
+        total_chlor = waste.total_chlor
         
-        # Calculate total chlorinated fraction from the provided waste composition.
-        total_chlor = (
-            waste.composition.get("pharmaceutical_waste", {}).get("pharmaceuticals_halogenated", 0) +
-            waste.composition.get("chemical_waste", {}).get("cytotoxic_halogenated", 0)
-        )
+        # Heavy metal fractions of the flat composition.
+        comp = waste.composition
+        hg_frac = comp.get("mercury_waste", 0.0)
+        pb_frac = comp.get("other_heavy_metals", 0.0)
         
         # Convert waste mass to kilograms.
         mass = waste.mass.to("kg").magnitude
         
         # Calculate emissions for each pollutant.
         emissions = {
-            "co2_fossil": mass * total_organic * f["co2_fossil_per_organic"] * ureg("kg"),
-            "ch4_fossil": mass * total_organic * f["ch4_fossil_per_organic"] * ureg("kg"),
-            "nmvoc": mass * total_organic * f["nmvoc_per_organic"] * ureg("kg"),
-            "pahs": mass * total_organic * f["pahs_per_organic"] * ureg("kg"),
-            "dioxin": mass * total_chlor * f["dioxin_per_chlorinated"] * ureg("kg"),
-            "hg": mass * waste.composition.get("heavy_metals_waste", {}).get("mercury_waste", 0) * f["hg_per_mercury"] * ureg("kg"),
-            "pb": mass * waste.composition.get("heavy_metals_waste", {}).get("other_heavy_metals", 0) * f["pb_per_heavy_metal"] * ureg("kg"),
+            "co2_fossil": mass * total_organic * f.co2_fossil_per_organic * _KG,
+            "ch4_fossil": mass * total_organic * f.ch4_fossil_per_organic * _KG,
+            "nmvoc": mass * total_organic * f.nmvoc_per_organic * _KG,
+            "pahs": mass * total_organic * f.pahs_per_organic * _KG,
+            "dioxin": mass * total_chlor * f.dioxin_per_chlorinated * _KG,
+            "hg": mass * hg_frac * f.hg_per_mercury * _KG,
+            "pb": mass * pb_frac * f.pb_per_heavy_metal * _KG,
         }
         
         logging.debug(f"{self.name} - Calculated emissions: {emissions}")
         return emissions
+
+    def calculate_direct_emissions_batch(self, masses: np.ndarray, comp_matrix: np.ndarray,
+                                         scenario: dict = None) -> dict:
+        """
+        Vectorized counterpart of calculate_direct_emissions for many waste streams at once.
+
+        Args:
+            masses (np.ndarray): A (N,) array of waste masses in kg.
+            comp_matrix (np.ndarray): A (N, len(config.COMPONENT_INDEX)) array of composition
+                fractions, e.g. as built by src.waste_stream.stack_waste_streams.
+            scenario (dict, optional): Unused, kept for parity with calculate_direct_emissions.
+
+        Returns:
+            dict: A dictionary mapping emission keys to (N,) arrays wrapped as Pint quantities in kg.
+        """
+        f = self._factors_tuple
+
+        masses = np.ascontiguousarray(masses, dtype=np.float64)
+        comp_matrix = np.asarray(comp_matrix, dtype=np.float64)
+        out = np.empty((len(PYROLYSIS_OUTPUTS), masses.shape[0]), dtype=np.float64)
+        pyrolysis_kernel(
+            masses,
+            comp_matrix @ config.ORGANIC_WEIGHTS,
+            comp_matrix @ config.CHLORINATED_WEIGHTS,
+            np.ascontiguousarray(comp_matrix[:, config.MERCURY_COL]),
+            np.ascontiguousarray(comp_matrix[:, config.LEAD_COL]),
+            f.co2_fossil_per_organic, f.ch4_fossil_per_organic, f.nmvoc_per_organic,
+            f.pahs_per_organic, f.dioxin_per_chlorinated, f.hg_per_mercury, f.pb_per_heavy_metal,
+            out,
+        )
+        emissions = dict(zip(PYROLYSIS_OUTPUTS, out))
+        return {key: value * _KG for key, value in emissions.items()}
@@ -1,35 +1,168 @@
 # src/waste_stream.py
-import copy
-from dataclasses import dataclass, field
-from typing import Dict
-import pint
+from types import MappingProxyType
+from dataclasses import dataclass, field, replace
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, Mapping, Optional, Tuple
+import numpy as np
 from src import config
-from src.units import ureg
 
-@dataclass
+if TYPE_CHECKING:
+    import pint
+
+def flatten_composition(composition: Mapping[str, Any]) -> Dict[str, float]:
+    """
+    Flattens a grouped composition (as in config.DEFAULT_COMPOSITION) into a single-level
+    dictionary keyed by item name. Item names are unique across groups. Entries that are
+    already flat (item -> fraction) are kept as they are, so mixed compositions are accepted.
+
+    Args:
+        composition (Mapping[str, Any]): The grouped (or partly grouped) composition.
+
+    Returns:
+        Dict[str, float]: A new dictionary mapping each item to its fraction.
+    """
+    flat = {}
+    for name, value in composition.items():
+        if isinstance(value, Mapping):
+            flat.update(value)
+        else:
+            flat[name] = value
+    return flat
+
+
+# Read-only flat snapshot of config.DEFAULT_COMPOSITION, taken once at import. New streams
+# get a shallow copy of it, which is all a dictionary of floats needs.
+_DEFAULT_COMPOSITION = MappingProxyType(flatten_composition(config.DEFAULT_COMPOSITION))
+
+# Fetch all organic / chlorinated fractions of a flat composition in one call.
+_ORGANIC_GETTER = itemgetter(*config.ORGANIC_ITEMS)
+_CHLORINATED_GETTER = itemgetter(*config.CHLORINATED_ITEMS)
+
+
+def _sum_fractions(composition: Mapping[str, float], getter: itemgetter, items: Tuple[str, ...]) -> float:
+    """
+    Sums the fractions of `items` in a flat composition. Partial compositions (missing
+    items count as zero) fall back to per-item lookups.
+    """
+    try:
+        return sum(getter(composition))
+    except KeyError:
+        return sum(composition.get(item, 0) for item in items)
+
+
+@dataclass(frozen=True, slots=True)
 class WasteStream:
     """
     Represents a waste stream with a given mass (with unit) and a material composition.
 
     Attributes:
         mass (pint.Quantity): The total mass of the waste stream. e.g., 100 * ureg("kg").
-        composition (Dict[str, Dict[str, float]]): A nested dictionary that defines the fraction
-            of each material group present in the waste, e.g.:
+        composition (Mapping[str, float]): A flat, read-only mapping that defines the fraction
+            of each material item present in the waste, e.g.:
                 {
-                    "general_waste": { ... },
-                    "infectious_waste": { ... },
-                    "sharps_waste": { ... },
-                    "pharmaceutical_waste": { ... },
-                    "chemical_waste": { ... },
-                    "heavy_metals_waste": { ... },
-                    "radioactive_waste": { ... }
+                    "non_hazardous": 0.65,
+                    "body_fluids": 0.12,
+                    "needles_sharps_plastic": 0.02,
+                    ...
                 }
-            The default composition is loaded from the config module.
+            The default composition is loaded from the config module. A grouped composition
+            in the layout of config.DEFAULT_COMPOSITION is also accepted and flattened on
+            construction; use the `grouped` property to get that layout back.
+
+    Instances are frozen: methods such as adjust_for_segregation return a new stream instead
+    of modifying this one. The composition given on construction is copied into a read-only
+    MappingProxyType, which is what allows the fraction sums (total_organic, total_chlor) and
+    the composition vector to be memoized. To change a composition, build a new stream from
+    dict(stream.composition).
     """
-    mass: pint.Quantity  # e.g., 100 * ureg("kg")
-    composition: Dict[str, Dict[str, float]] = field(
-        default_factory=lambda: copy.deepcopy(config.DEFAULT_COMPOSITION)
+    mass: "pint.Quantity"  # e.g., 100 * ureg("kg")
+    composition: Mapping[str, float] = field(
+        default_factory=lambda: dict(_DEFAULT_COMPOSITION)
     )
+    # Memoized fraction sums and composition vector, filled on first access.
+    _total_organic: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _total_chlor: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _vec: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    # Maps each item name to the material group it belongs to in config.DEFAULT_COMPOSITION.
+    _GROUP_OF: ClassVar[Dict[str, str]] = {
+        item: group for group, items in config.DEFAULT_COMPOSITION.items() for item in items
+    }
+
+    def __post_init__(self):
+        # Store a private, read-only copy so the memoized values cannot go stale.
+        if any(isinstance(v, Mapping) for v in self.composition.values()):
+            composition = flatten_composition(self.composition)
+        else:
+            composition = dict(self.composition)
+        object.__setattr__(self, "composition", MappingProxyType(composition))
+
+    @classmethod
+    def from_vec(cls, mass: "pint.Quantity", vec: np.ndarray) -> 'WasteStream':
+        """
+        Creates a waste stream from a composition vector laid out along config.COMPONENT_INDEX.
+
+        Args:
+            mass (pint.Quantity): The total mass of the waste stream.
+            vec (np.ndarray): A (len(config.COMPONENT_INDEX),) array of composition fractions.
+
+        Returns:
+            WasteStream: A new WasteStream instance whose `vec` is (a copy of) the given vector.
+        """
+        vec = np.array(vec, dtype=np.float64)
+        if vec.shape != (len(config.COMPONENT_INDEX),):
+            raise ValueError(f"Expected a composition vector of shape ({len(config.COMPONENT_INDEX)},), "
+                             f"got {vec.shape}.")
+        vec.setflags(write=False)
+        stream = cls(mass=mass, composition=dict(zip(config.COMPONENT_INDEX, vec.tolist())))
+        object.__setattr__(stream, "_vec", vec)
+        return stream
+
+    @property
+    def vec(self) -> np.ndarray:
+        """
+        The composition laid out along config.COMPONENT_INDEX, as a read-only float64 array.
+        Items outside config.COMPONENT_INDEX are not represented. Memoized, which is safe
+        because the composition itself is read-only.
+        """
+        if self._vec is None:
+            vec = np.fromiter((self.composition.get(name, 0.0) for name in config.COMPONENT_INDEX),
+                              dtype=np.float64, count=len(config.COMPONENT_INDEX))
+            vec.setflags(write=False)
+            object.__setattr__(self, "_vec", vec)
+        return self._vec
+
+    @property
+    def grouped(self) -> Dict[str, Dict[str, float]]:
+        """
+        The composition in the grouped layout of config.DEFAULT_COMPOSITION. Items that do not
+        appear in the default composition are placed under "other_waste".
+        """
+        grouped = {}
+        for item, frac in self.composition.items():
+            grouped.setdefault(self._GROUP_OF.get(item, "other_waste"), {})[item] = frac
+        return grouped
+
+    @property
+    def total_organic(self) -> float:
+        """The sum of the organic fractions (config.ORGANIC_ITEMS)."""
+        if self._total_organic is None:
+            total = _sum_fractions(self.composition, _ORGANIC_GETTER, config.ORGANIC_ITEMS)
+            object.__setattr__(self, "_total_organic", total)
+        return self._total_organic
+
+    @property
+    def fossil_organic(self) -> float:
+        """The fossil-derived (plastic) part of the organic fraction."""
+        return self.composition.get(config.FOSSIL_ORGANIC_ITEM, 0)
+
+    @property
+    def total_chlor(self) -> float:
+        """The sum of the chlorinated fractions (config.CHLORINATED_ITEMS)."""
+        if self._total_chlor is None:
+            total = _sum_fractions(self.composition, _CHLORINATED_GETTER, config.CHLORINATED_ITEMS)
+            object.__setattr__(self, "_total_chlor", total)
+        return self._total_chlor
 
     def adjust_for_segregation(self, efficiency: float) -> 'WasteStream':
         """
@@ -53,16 +186,34 @@ class WasteStream:
         Returns:
             WasteStream: A new WasteStream instance with the adjusted composition.
         """
-        # Create a deep copy of the current composition so as not to modify the original.
-        new_comp = copy.deepcopy(self.composition)
+        # Copy the current composition so as not to modify the original.
+        new_comp = dict(self.composition)
         
         # Adjust hazardous fractions based on the provided segregation efficiency.
-        if "needles_sharps_plastic" in new_comp.get("sharps_waste", {}):
-            new_comp["sharps_waste"]["needles_sharps_plastic"] *= (1 - efficiency)
-        if "cytotoxic_organic" in new_comp.get("chemical_waste", {}):
-            new_comp["chemical_waste"]["cytotoxic_organic"] *= (1 - efficiency)
-        if "lab_reagents" in new_comp.get("chemical_waste", {}):
-            new_comp["chemical_waste"]["lab_reagents"] *= (1 - efficiency)
+        for item in ("needles_sharps_plastic", "cytotoxic_organic", "lab_reagents"):
+            if item in new_comp:
+                new_comp[item] *= (1 - efficiency)
         
         # Return a new WasteStream instance with the same mass but adjusted composition.
-        return WasteStream(mass=self.mass, composition=new_comp)
+        return replace(self, composition=new_comp)
+
+
+def stack_waste_streams(streams: Iterable[WasteStream]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs a collection of waste streams into contiguous arrays for batch calculations.
+
+    Args:
+        streams (Iterable[WasteStream]): The waste streams to pack.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A (N,) array of masses in kg and a
+            (N, len(config.COMPONENT_INDEX)) array of composition fractions, with columns
+            ordered as in config.COMPONENT_INDEX. Fractions missing from a stream are 0.
+    """
+    streams = list(streams)
+    masses = np.fromiter((ws.mass.to("kg").magnitude for ws in streams),
+                         dtype=np.float64, count=len(streams))
+    comp_matrix = np.empty((len(streams), len(config.COMPONENT_INDEX)), dtype=np.float64)
+    for row, ws in enumerate(streams):
+        comp_matrix[row] = ws.vec
+    return masses, comp_matrix
@@ -2,8 +2,8 @@
 
 import unittest
 import logging
+import tempfile
 from pathlib import Path
-from types import SimpleNamespace
 
 import brightway2 as bw
 import pint
@@ -33,7 +33,7 @@ class TestDatabaseFunctions(unittest.TestCase):
         """
         cls.test_project_name = "TestProjectForDatabaseTests"
         cls.bio_db = setup_project(cls.test_project_name)
-        cls.flow_index = build_flow_index(cls.bio_db)
+        cls.flow_index = build_flow_index(cls.bio_db, cache_dir=None)
         cls.flows = retrieve_flows(cls.flow_index)
         cls.test_db_name = "TestDB"
         cls.test_db = create_or_reset_db(cls.test_db_name)
@@ -50,6 +50,16 @@ class TestDatabaseFunctions(unittest.TestCase):
         # Check that at least one expected key exists (e.g., 'co2_fossil').
         self.assertIn("co2_fossil", self.flows, "The 'co2_fossil' flow should be present in the retrieved flows.")
 
+    def test_flow_index_cache(self):
+        """Test that a cached flow index is written on first build and reloaded unchanged."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            fresh = build_flow_index(self.bio_db, cache_dir=cache_dir)
+            self.assertEqual(len(list(cache_dir.glob("flow_index_*.pkl"))), 1,
+                             "Building the flow index should write one cache file.")
+            cached = build_flow_index(self.bio_db, cache_dir=cache_dir)
+            self.assertEqual(cached, fresh, "The cached flow index should match the freshly built one.")
+
     def test_create_or_reset_db(self):
         """Test that a new database can be created or reset."""
         # After creating, the database name should be in bw.databases.
@@ -93,11 +103,11 @@ class TestDatabaseFunctions(unittest.TestCase):
             "pm25": 0 * ureg("kg")  # This one is negligible and should be skipped.
         }
         
-        # Create a dummy flows dictionary. Each flow is a simple object with a 'key' attribute.
+        # Create a dummy flows dictionary mapping each flow name to its key.
         dummy_flows = {
-            "co2_fossil": SimpleNamespace(key="dummy_key_co2"),
-            "so2": SimpleNamespace(key="dummy_key_so2"),
-            "pm25": SimpleNamespace(key="dummy_key_pm25")
+            "co2_fossil": "dummy_key_co2",
+            "so2": "dummy_key_so2",
+            "pm25": "dummy_key_pm25"
         }
         
         # Add biosphere exchanges.
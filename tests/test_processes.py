@@ -2,7 +2,7 @@
 
 import unittest
 import pint
-from src.waste_stream import WasteStream
+from src.waste_stream import WasteStream, stack_waste_streams
 from src.processes.incineration import IncinerationProcess
 from src.processes.landfill import LandfillProcess
 from src.processes.pyrolysis import PyrolysisProcess
@@ -10,6 +10,7 @@ from src.processes.chem_disinfection import ChemDisinfectionProcess
 from src.processes.autoclave import AutoclaveProcess
 from src.processes.microwave import MicrowaveProcess
 from src import config
+from src.units import ureg as src_ureg
 
 # Initialize the Pint unit registry.
 ureg = pint.UnitRegistry()
@@ -27,6 +28,20 @@ class TestProcesses(unittest.TestCase):
             "chemical_disinfection_fraction": 0.5
         }
 
+    def _assert_batch_matches_scalar(self, proc, label):
+        """Check that the batch emissions of `proc` match its scalar results stream by stream."""
+        streams = [
+            WasteStream(mass=m * src_ureg("kg")).adjust_for_segregation(eff)
+            for m, eff in [(100, 0.0), (2174, 0.5), (113, 0.9)]
+        ]
+        masses, comp_matrix = stack_waste_streams(streams)
+        batch = proc.calculate_direct_emissions_batch(masses, comp_matrix, scenario=self.scenario)
+        for i, ws in enumerate(streams):
+            single = proc.calculate_direct_emissions(ws, scenario=self.scenario)
+            for key, value in single.items():
+                self.assertAlmostEqual(batch[key][i].to("kg").magnitude, value.to("kg").magnitude,
+                                       msg=f"Batch {label} '{key}' should match the scalar result.")
+
     def test_incineration_process(self):
         proc = IncinerationProcess("Incineration", config.EMISSION_FACTORS["INCINERATION"])
         emissions = proc.calculate_direct_emissions(self.waste_stream, scenario=self.scenario)
@@ -35,6 +50,27 @@ class TestProcesses(unittest.TestCase):
             self.assertIn(key, emissions, f"Incineration emissions should include '{key}'.")
             self.assertTrue(hasattr(emissions[key], "units"), f"Emission '{key}' should have units.")
 
+    def test_incineration_batch_matches_scalar(self):
+        proc = IncinerationProcess("Incineration", config.EMISSION_FACTORS["INCINERATION"])
+        self._assert_batch_matches_scalar(proc, "incineration")
+
+    def test_incineration_factors_convert_units(self):
+        factors = dict(config.EMISSION_FACTORS["INCINERATION"])
+        factors["energy_content"] = 19.08 * src_ureg("MJ/kg")
+        frozen = config.IncinerationFactors.from_mapping(factors)
+        self.assertAlmostEqual(frozen.energy_content, 5.3,
+                               msg="Energy content should be converted to kWh/kg before freezing.")
+
+    def test_incineration_combustion_penalty(self):
+        waste = WasteStream(mass=100 * src_ureg("kg"))
+        base = IncinerationProcess("Incineration", config.EMISSION_FACTORS["INCINERATION"])
+        poor_factors = dict(config.EMISSION_FACTORS["INCINERATION"], combustion_efficiency=0.90)
+        poor = IncinerationProcess("Incineration", poor_factors)
+        base_pm10 = base.calculate_direct_emissions(waste)["pm10"].magnitude
+        poor_pm10 = poor.calculate_direct_emissions(waste)["pm10"].magnitude
+        self.assertAlmostEqual(poor_pm10, base_pm10 * 1.1,
+                               msg="PM10 should rise by twice the efficiency shortfall below 0.95.")
+
     def test_landfill_process(self):
         proc = LandfillProcess("Landfill", config.EMISSION_FACTORS["LANDFILL"])
         emissions = proc.calculate_direct_emissions(self.waste_stream, scenario=self.scenario)
@@ -51,6 +87,10 @@ class TestProcesses(unittest.TestCase):
             self.assertIn(key, emissions, f"Pyrolysis emissions should include '{key}'.")
             self.assertTrue(hasattr(emissions[key], "units"), f"Emission '{key}' should have units.")
 
+    def test_pyrolysis_batch_matches_scalar(self):
+        proc = PyrolysisProcess("Pyrolysis", config.EMISSION_FACTORS["PYROLYSIS"])
+        self._assert_batch_matches_scalar(proc, "pyrolysis")
+
     def test_chem_disinfection_process(self):
         # Use dummy emission factors if CHEM_DISINFECTION factors are not defined in config.
         chem_factors = config.EMISSION_FACTORS.get("CHEM_DISINFECTION", {
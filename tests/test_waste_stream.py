@@ -1,6 +1,7 @@
 # HospitalWasteManagement/tests/test_waste_stream.py
 
 import unittest
+from dataclasses import FrozenInstanceError
 import pint
 from src.waste_stream import WasteStream
 from src import config  # To compare against default configuration values
@@ -17,19 +18,19 @@ class TestWasteStream(unittest.TestCase):
     def test_adjust_for_segregation(self):
         """
         Test that the adjust_for_segregation method correctly scales hazardous fractions.
-        For example, the 'needles_sharps_plastic' fraction in the organic materials should
-        be multiplied by the provided efficiency factor.
+        For example, the 'needles_sharps_plastic' fraction should be multiplied by
+        (1 - efficiency).
         """
         efficiency = 0.5
         adjusted_ws = self.waste_stream.adjust_for_segregation(efficiency)
         
         # Retrieve the original and adjusted fraction for needles_sharps_plastic.
-        original_value = self.waste_stream.composition["organic_materials"].get("needles_sharps_plastic", 0)
-        adjusted_value = adjusted_ws.composition["organic_materials"].get("needles_sharps_plastic", 0)
+        original_value = self.waste_stream.composition.get("needles_sharps_plastic", 0)
+        adjusted_value = adjusted_ws.composition.get("needles_sharps_plastic", 0)
         
         self.assertAlmostEqual(
             adjusted_value,
-            original_value * efficiency,
+            original_value * (1 - efficiency),
             msg="The 'needles_sharps_plastic' fraction should be reduced by the efficiency factor."
         )
 
@@ -41,8 +42,8 @@ class TestWasteStream(unittest.TestCase):
         _ = self.waste_stream.adjust_for_segregation(efficiency)
         
         # The original value should remain equal to the default value from the configuration.
-        expected_value = config.DEFAULT_COMPOSITION["organic_materials"]["needles_sharps_plastic"]
-        original_value = self.waste_stream.composition["organic_materials"]["needles_sharps_plastic"]
+        expected_value = config.DEFAULT_COMPOSITION["sharps_waste"]["needles_sharps_plastic"]
+        original_value = self.waste_stream.composition["needles_sharps_plastic"]
         
         self.assertAlmostEqual(
             original_value,
@@ -50,5 +51,65 @@ class TestWasteStream(unittest.TestCase):
             msg="The original waste stream composition should remain unchanged after adjustment."
         )
 
+    def test_grouped_composition_round_trip(self):
+        """
+        Test that a grouped composition is flattened on construction and that the grouped
+        view reproduces it.
+        """
+        ws = WasteStream(mass=self.mass, composition=config.DEFAULT_COMPOSITION)
+        self.assertEqual(ws.composition, self.waste_stream.composition,
+                         "A grouped composition should be flattened to the default flat layout.")
+        self.assertEqual(ws.grouped, config.DEFAULT_COMPOSITION,
+                         "The grouped view should match the default grouped composition.")
+        mixed_ws = WasteStream(mass=self.mass,
+                               composition={"general_waste": {"non_hazardous": 0.8}, "body_fluids": 0.1})
+        self.assertEqual(mixed_ws.composition, {"non_hazardous": 0.8, "body_fluids": 0.1},
+                         "A composition mixing groups and flat items should be flattened.")
+
+    def test_waste_stream_is_frozen(self):
+        """Test that the fields of a WasteStream cannot be reassigned and its composition is read-only."""
+        with self.assertRaises(FrozenInstanceError):
+            self.waste_stream.composition = {}
+        with self.assertRaises(TypeError):
+            self.waste_stream.composition["non_hazardous"] = 0
+        source = {"non_hazardous": 0.5}
+        ws = WasteStream(mass=self.mass, composition=source)
+        source["non_hazardous"] = 0
+        self.assertEqual(ws.composition["non_hazardous"], 0.5,
+                         "Editing the source dictionary should not affect the stream.")
+
+    def test_fraction_sums(self):
+        """Test that the memoized fraction sums match the composition and follow segregation."""
+        expected = sum(self.waste_stream.composition[item] for item in config.ORGANIC_ITEMS)
+        self.assertIsNone(self.waste_stream._total_organic)
+        self.assertAlmostEqual(self.waste_stream.total_organic, expected)
+        self.assertAlmostEqual(self.waste_stream._total_organic, expected,
+                               msg="The first access should memoize the sum on the stream.")
+        adjusted_ws = self.waste_stream.adjust_for_segregation(1.0)
+        self.assertIsNone(adjusted_ws._total_organic,
+                          "A segregated copy should start without a memoized sum.")
+        self.assertAlmostEqual(
+            adjusted_ws.total_organic,
+            expected - self.waste_stream.composition["needles_sharps_plastic"]
+            - self.waste_stream.composition["cytotoxic_organic"],
+            msg="A segregated stream should not reuse the original stream's memoized sum."
+        )
+        self.assertAlmostEqual(self.waste_stream.total_chlor, 0.015)
+        partial_ws = WasteStream(mass=self.mass, composition={"non_hazardous": 0.5, "cytotoxic_halogenated": 0.1})
+        self.assertAlmostEqual(partial_ws.total_organic, 0.5)
+        self.assertAlmostEqual(partial_ws.total_chlor, 0.1)
+
+    def test_composition_vector_round_trip(self):
+        """Test that the composition vector follows COMPONENT_INDEX and round-trips via from_vec."""
+        self.assertEqual(self.waste_stream.vec.tolist(), config.DEFAULT_COMPOSITION_VEC.tolist())
+        ws = WasteStream.from_vec(self.mass, config.DEFAULT_COMPOSITION_VEC)
+        self.assertEqual(ws.composition, self.waste_stream.composition,
+                         "from_vec should rebuild the flat composition.")
+        with self.assertRaises(ValueError):
+            WasteStream.from_vec(self.mass, config.DEFAULT_COMPOSITION_VEC[:-1])
+        with self.assertRaises(TypeError):
+            ws.composition["non_hazardous"] = 0.0
+        self.assertFalse(ws.vec.flags.writeable, "The memoized vector should be read-only.")
+
 if __name__ == '__main__':
     unittest.main()